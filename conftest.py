@@ -0,0 +1,25 @@
+"""
+pytest-Fixtures für test_suite.py
+=================================
+
+Die Testfunktionen laufen sowohl mit ``python test_suite.py`` als auch mit
+pytest. Unter pytest liefern diese Fixtures dieselben gemeinsamen Instanzen
+(``get_model``/``get_analyzer``), die ``main()`` an die Tests übergibt.
+
+Autor: GTT Theory Group
+"""
+
+import pytest
+from test_suite import get_analyzer, get_model
+
+
+@pytest.fixture(scope='session')
+def model():
+    """Ein GTTModel für die ganze Sitzung"""
+    return get_model()
+
+
+@pytest.fixture(scope='session')
+def analyzer():
+    """GTTAnalyzer über dem gemeinsamen Modell"""
+    return get_analyzer()
@@ -8,68 +8,150 @@ Dieses Modul vergleicht GTT-Vorhersagen mit aktuellen Beobachtungsdaten
 Autor: GTT Theory Group
 """
 
+import io
+import math
+import sys
 import numpy as np
-import matplotlib.pyplot as plt
-from typing import Dict, List, Tuple
-from gtt_model import GTTModel, CosmologyParameters, GTTParameters
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Sequence, TextIO, Tuple, Union
+from gtt_model import GTTModel, CosmologyParameters, GTTParameters, GTTPredictions
+
+
+# Layout des Analyse-Reports (siehe GTTAnalyzer.generate_report)
+REPORT_TEMPLATE = """\
+======================================================================
+GTT-WELTFORMEL: Vollständiger Analyse-Report
+======================================================================
+
+1. VERGLEICH MIT PLANCK 2018
+----------------------------------------------------------------------
+H0 (GTT):     {planck[H0_gtt]:.2f} km/s/Mpc
+H0 (Planck):  {planck[H0_planck]:.2f} km/s/Mpc
+Abweichung:   {planck[H0_sigma]:.1f}σ
+Kompatibel:   {planck_compatible}
+
+2. VERGLEICH MIT SH0ES 2022
+----------------------------------------------------------------------
+H0 (GTT spät): {sh0es[H0_gtt_late]:.2f} km/s/Mpc
+H0 (SH0ES):    {sh0es[H0_sh0es]:.2f} km/s/Mpc
+Abweichung:    {sh0es[H0_sigma]:.1f}σ
+Spannung gelöst: {tension_resolved}
+
+3. CMB-S4 DETEKTIONS-VORHERSAGEN (2030-2035)
+----------------------------------------------------------------------
+β_iso:         {cmb_s4[beta_iso]:.3f}
+Sensitivität:  {cmb_s4[beta_iso_sensitivity]:.3f}
+Signifikanz:   {cmb_s4[beta_iso_sigma]:.1f}σ
+Nachweisbar:   {beta_iso_detectable}
+
+r (tensor):    {cmb_s4[r_tensor]:.4f}
+Sensitivität:  {cmb_s4[r_sensitivity]:.4f}
+Nachweisbar:   {r_detectable}
+
+4. LEGEND-1000 DETEKTIONS-VORHERSAGEN (2030+)
+----------------------------------------------------------------------
+⟨m_ββ⟩:        {legend[m_betabeta_meV]:.1f} meV
+Sensitivität:  {legend[m_bb_sensitivity_meV]:.1f} meV
+Signifikanz:   {legend[m_bb_sigma]:.1f}σ
+Nachweisbar:   {m_bb_detectable}
+Entdeckungs-Wahrscheinlichkeit: {legend[discovery_probability]:.0%}
+
+5. VERGLEICH MIT DESI 2024
+----------------------------------------------------------------------
+S_8 (GTT):     {desi[S_8_gtt]:.3f}
+S_8 (DESI):    {desi[S_8_desi]:.3f}
+Abweichung:    {desi[S_8_sigma]:.1f}σ
+Kompatibel:    {desi_compatible}
+
+6. FALSIFIKATIONSKRITERIEN
+----------------------------------------------------------------------
+{criteria}\
+======================================================================"""
+
+# Teil vor bzw. nach den Falsifikationskriterien (für stream_report)
+_REPORT_HEAD, _REPORT_TAIL = REPORT_TEMPLATE.split('{criteria}')
+
+_JA_NEIN = {True: 'Ja', False: 'Nein'}
+
+# Referenz-Dimension, auf die die σ_8-Unterdrückung normiert ist
+_D_REFERENCE = 2.79167
+_INV_SUPPRESSION_NORM = 1.0 / (3.0 - _D_REFERENCE)
+
+
+# Beobachtungsdaten als unveränderliche Konstanten (einmal pro Prozess angelegt);
+# direkt importierbar oder über ObservationalData erreichbar
+PLANCK_2018 = MappingProxyType({
+    'H0': 67.4,
+    'H0_err': 0.5,
+    'Omega_b': 0.0493,
+    'Omega_cdm': 0.264,
+    'n_s': 0.9649,
+    'n_s_err': 0.0042,
+    'A_s': 2.1e-9,
+    'A_s_err': 0.03e-9,
+    'tau_reio': 0.0544,
+    'sigma_8': 0.811,
+    'sigma_8_err': 0.006,
+    'S_8': 0.834,
+    'S_8_err': 0.016
+})
+
+SH0ES_2022 = MappingProxyType({
+    'H0': 73.04,
+    'H0_err': 1.04
+})
+
+CMB_S4_SENSITIVITY = MappingProxyType({
+    'beta_iso_sensitivity': 0.008,
+    'r_sensitivity': 0.001,
+    'n_s_err': 0.002
+})
+
+LEGEND_1000_SENSITIVITY = MappingProxyType({
+    'm_bb_sensitivity_meV': 10.0,  # meV
+    'half_life_years': 1e28
+})
+
+DESI_2024 = MappingProxyType({
+    'H0': 68.5,
+    'H0_err': 1.2,
+    'S_8': 0.76,
+    'S_8_err': 0.03
+})
 
 
 class ObservationalData:
-    """Container für Beobachtungsdaten"""
+    """Container für Beobachtungsdaten (schreibgeschützte Mappings)"""
     
     @staticmethod
-    def planck_2018() -> Dict:
+    def planck_2018() -> Mapping:
         """Planck 2018 Ergebnisse"""
-        return {
-            'H0': 67.4,
-            'H0_err': 0.5,
-            'Omega_b': 0.0493,
-            'Omega_cdm': 0.264,
-            'n_s': 0.9649,
-            'n_s_err': 0.0042,
-            'A_s': 2.1e-9,
-            'A_s_err': 0.03e-9,
-            'tau_reio': 0.0544,
-            'sigma_8': 0.811,
-            'sigma_8_err': 0.006,
-            'S_8': 0.834,
-            'S_8_err': 0.016
-        }
+        return PLANCK_2018
     
     @staticmethod
-    def sh0es_2022() -> Dict:
+    def sh0es_2022() -> Mapping:
         """SH0ES 2022 lokale H0-Messung"""
-        return {
-            'H0': 73.04,
-            'H0_err': 1.04
-        }
+        return SH0ES_2022
     
     @staticmethod
-    def cmb_s4_sensitivity() -> Dict:
+    def cmb_s4_sensitivity() -> Mapping:
         """CMB-S4 erwartete Sensitivität"""
-        return {
-            'beta_iso_sensitivity': 0.008,
-            'r_sensitivity': 0.001,
-            'n_s_err': 0.002
-        }
+        return CMB_S4_SENSITIVITY
     
     @staticmethod
-    def legend_1000_sensitivity() -> Dict:
+    def legend_1000_sensitivity() -> Mapping:
         """LEGEND-1000 Sensitivität für 0νββ"""
-        return {
-            'm_bb_sensitivity_meV': 10.0,  # meV
-            'half_life_years': 1e28
-        }
+        return LEGEND_1000_SENSITIVITY
     
     @staticmethod
-    def desi_2024() -> Dict:
+    def desi_2024() -> Mapping:
         """DESI 2024 BAO-Messungen"""
-        return {
-            'H0': 68.5,
-            'H0_err': 1.2,
-            'S_8': 0.76,
-            'S_8_err': 0.03
-        }
+        return DESI_2024
+
+
+def _falsification_for(cosmo: CosmologyParameters, gtt: GTTParameters) -> Dict:
+    """Falsifikationskriterien für einen Parametersatz (Worker für scan)"""
+    return GTTAnalyzer(GTTModel(cosmo, gtt)).falsification_criteria()
 
 
 class GTTAnalyzer:
@@ -109,24 +191,34 @@ class GTTAnalyzer:
         float
             χ²/DoF
         """
-        chi2 = np.sum(((C_l_theory - C_l_obs) / C_l_err)**2)
+        # Normierte Residuen in einem Puffer, χ² als Skalarprodukt (BLAS);
+        # vdot flacht mehrdimensionale Spektren (n_spec, n_ell) ab
+        r = np.subtract(C_l_theory, C_l_obs, dtype=np.float64)
+        r /= C_l_err
+        chi2 = np.vdot(r, r)
         dof = len(C_l_obs)
         return chi2 / dof
     
-    def compare_with_planck(self) -> Dict:
+    def compare_with_planck(self, pred: Optional[GTTPredictions] = None) -> Dict:
         """
         Vergleicht GTT-Vorhersagen mit Planck 2018
         
+        Parameters
+        ----------
+        pred : GTTPredictions, optional
+            Bereits berechnete Vorhersagen (``compute_predictions``)
+            
         Returns
         -------
         Dict
             Vergleichsergebnisse
         """
         planck = self.obs_data.planck_2018()
-        pred = self.model.compute_predictions()
+        if pred is None:
+            pred = self.model.compute_predictions()
         
         # H0-Vergleich
-        H0_early = pred['H0_early']
+        H0_early = pred.H0_early
         H0_planck = planck['H0']
         H0_sigma = abs(H0_early - H0_planck) / planck['H0_err']
         
@@ -148,19 +240,25 @@ class GTTAnalyzer:
         
         return results
     
-    def compare_with_sh0es(self) -> Dict:
+    def compare_with_sh0es(self, pred: Optional[GTTPredictions] = None) -> Dict:
         """
         Vergleicht mit SH0ES lokaler H0-Messung
         
+        Parameters
+        ----------
+        pred : GTTPredictions, optional
+            Bereits berechnete Vorhersagen (``compute_predictions``)
+            
         Returns
         -------
         Dict
             Vergleichsergebnisse
         """
         sh0es = self.obs_data.sh0es_2022()
-        pred = self.model.compute_predictions()
+        if pred is None:
+            pred = self.model.compute_predictions()
         
-        H0_late = pred['H0_late']
+        H0_late = pred.H0_late
         H0_sh0es = sh0es['H0']
         H0_sigma = abs(H0_late - H0_sh0es) / sh0es['H0_err']
         
@@ -169,30 +267,36 @@ class GTTAnalyzer:
             'H0_sh0es': H0_sh0es,
             'H0_sigma': H0_sigma,
             'H0_compatible': H0_sigma < 3.0,
-            'tension_resolved': pred['H0_tension_percent'] < 5.0
+            'tension_resolved': pred.H0_tension_percent < 5.0
         }
         
         return results
     
-    def predict_cmb_s4_detection(self) -> Dict:
+    def predict_cmb_s4_detection(self, pred: Optional[GTTPredictions] = None) -> Dict:
         """
         Vorhersage für CMB-S4 Detektion
         
+        Parameters
+        ----------
+        pred : GTTPredictions, optional
+            Bereits berechnete Vorhersagen (``compute_predictions``)
+            
         Returns
         -------
         Dict
             Detektions-Vorhersagen
         """
         cmb_s4 = self.obs_data.cmb_s4_sensitivity()
-        pred = self.model.compute_predictions()
+        if pred is None:
+            pred = self.model.compute_predictions()
         
         # β_iso Detektion
-        beta_iso = pred['beta_iso']
+        beta_iso = pred.beta_iso
         beta_iso_sens = cmb_s4['beta_iso_sensitivity']
         beta_iso_sigma = beta_iso / beta_iso_sens
         
         # r Detektion
-        r = pred['r_tensor']
+        r = pred.r_tensor
         r_sens = cmb_s4['r_sensitivity']
         r_sigma = r / r_sens
         
@@ -209,19 +313,25 @@ class GTTAnalyzer:
         
         return results
     
-    def predict_legend_detection(self) -> Dict:
+    def predict_legend_detection(self, pred: Optional[GTTPredictions] = None) -> Dict:
         """
         Vorhersage für LEGEND-1000 Detektion
         
+        Parameters
+        ----------
+        pred : GTTPredictions, optional
+            Bereits berechnete Vorhersagen (``compute_predictions``)
+            
         Returns
         -------
         Dict
             Detektions-Vorhersagen
         """
         legend = self.obs_data.legend_1000_sensitivity()
-        pred = self.model.compute_predictions()
+        if pred is None:
+            pred = self.model.compute_predictions()
         
-        m_bb = pred['m_betabeta_meV']
+        m_bb = pred.m_betabeta_meV
         m_bb_sens = legend['m_bb_sensitivity_meV']
         m_bb_sigma = m_bb / m_bb_sens
         
@@ -252,10 +362,10 @@ class GTTAnalyzer:
         
         # GTT-Korrektur: Unterdrückung durch fraktale Dimension
         D = self.model.gtt.D_asymptotic
-        suppression = (3.0 - D) / (3.0 - 2.79167)
+        suppression = (3.0 - D) * _INV_SUPPRESSION_NORM
         sigma_8_gtt = sigma_8 * suppression
         
-        S_8_gtt = sigma_8_gtt * np.sqrt(Omega_m / 0.3)
+        S_8_gtt = sigma_8_gtt * math.sqrt(Omega_m / 0.3)
         S_8_desi = desi['S_8']
         S_8_sigma = abs(S_8_gtt - S_8_desi) / desi['S_8_err']
         
@@ -269,27 +379,33 @@ class GTTAnalyzer:
         
         return results
     
-    def falsification_criteria(self) -> Dict:
+    def falsification_criteria(self, pred: Optional[GTTPredictions] = None) -> Dict:
         """
         Definiert Falsifikationskriterien
         
+        Parameters
+        ----------
+        pred : GTTPredictions, optional
+            Bereits berechnete Vorhersagen (``compute_predictions``)
+            
         Returns
         -------
         Dict
             Falsifikationskriterien und Status
         """
-        pred = self.model.compute_predictions()
+        if pred is None:
+            pred = self.model.compute_predictions()
         
         criteria = {
             'beta_iso': {
-                'prediction': pred['beta_iso'],
+                'prediction': pred.beta_iso,
                 'falsified_if_below': 0.002,
                 'falsified_if_above': 0.050,
                 'test': 'CMB-S4',
                 'year': 2030
             },
             'm_betabeta': {
-                'prediction_meV': pred['m_betabeta_meV'],
+                'prediction_meV': pred.m_betabeta_meV,
                 'falsified_if_below_meV': 10.0,
                 'falsified_if_above_meV': 20.0,
                 'test': 'LEGEND-1000',
@@ -302,7 +418,7 @@ class GTTAnalyzer:
                 'year': 2025
             },
             'r_tensor': {
-                'prediction': pred['r_tensor'],
+                'prediction': pred.r_tensor,
                 'falsified_if_above': 0.01,
                 'test': 'CMB-S4',
                 'year': 2030
@@ -311,6 +427,41 @@ class GTTAnalyzer:
         
         return criteria
     
+    def scan(self, gtt_grid: Union[Sequence[GTTParameters], np.ndarray],
+             n_jobs: int = 1) -> List[Dict]:
+        """
+        Wertet die Falsifikationskriterien für ein Parametergitter aus
+        
+        Die Kosmologie-Parameter werden vom Modell übernommen. Mit
+        ``n_jobs != 1`` werden die Gitterpunkte mit joblib parallel
+        berechnet; bei kleinen Gittern überwiegt dabei der Overhead.
+        
+        Parameters
+        ----------
+        gtt_grid : Sequence[GTTParameters] or np.ndarray
+            Liste von GTTParameters oder strukturiertes Array mit
+            dtype ``GTT_PARAMS_DTYPE``
+        n_jobs : int, optional
+            Anzahl paralleler Prozesse (-1: alle Kerne, Standard: 1)
+            
+        Returns
+        -------
+        List[Dict]
+            Falsifikationskriterien pro Gitterpunkt
+        """
+        if isinstance(gtt_grid, np.ndarray):
+            gtt_grid = [GTTParameters(**{name: float(row[name])
+                                         for name in gtt_grid.dtype.names})
+                        for row in gtt_grid]
+        
+        cosmo = self.model.cosmo
+        if n_jobs == 1:
+            return [_falsification_for(cosmo, gtt) for gtt in gtt_grid]
+        
+        from joblib import Parallel, delayed  # optional, nur für n_jobs != 1
+        return Parallel(n_jobs=n_jobs)(
+            delayed(_falsification_for)(cosmo, gtt) for gtt in gtt_grid)
+    
     def generate_report(self) -> str:
         """
         Generiert vollständigen Analyse-Report
@@ -320,83 +471,48 @@ class GTTAnalyzer:
         str
             Formatierter Report
         """
-        report = []
-        report.append("=" * 70)
-        report.append("GTT-WELTFORMEL: Vollständiger Analyse-Report")
-        report.append("=" * 70)
-        report.append("")
-        
-        # Planck-Vergleich
-        report.append("1. VERGLEICH MIT PLANCK 2018")
-        report.append("-" * 70)
-        planck_comp = self.compare_with_planck()
-        report.append(f"H0 (GTT):     {planck_comp['H0_gtt']:.2f} km/s/Mpc")
-        report.append(f"H0 (Planck):  {planck_comp['H0_planck']:.2f} km/s/Mpc")
-        report.append(f"Abweichung:   {planck_comp['H0_sigma']:.1f}σ")
-        report.append(f"Kompatibel:   {'Ja' if planck_comp['H0_compatible'] else 'Nein'}")
-        report.append("")
-        
-        # SH0ES-Vergleich
-        report.append("2. VERGLEICH MIT SH0ES 2022")
-        report.append("-" * 70)
-        sh0es_comp = self.compare_with_sh0es()
-        report.append(f"H0 (GTT spät): {sh0es_comp['H0_gtt_late']:.2f} km/s/Mpc")
-        report.append(f"H0 (SH0ES):    {sh0es_comp['H0_sh0es']:.2f} km/s/Mpc")
-        report.append(f"Abweichung:    {sh0es_comp['H0_sigma']:.1f}σ")
-        report.append(f"Spannung gelöst: {'Ja' if sh0es_comp['tension_resolved'] else 'Nein'}")
-        report.append("")
-        
-        # CMB-S4 Vorhersagen
-        report.append("3. CMB-S4 DETEKTIONS-VORHERSAGEN (2030-2035)")
-        report.append("-" * 70)
-        cmb_s4 = self.predict_cmb_s4_detection()
-        report.append(f"β_iso:         {cmb_s4['beta_iso']:.3f}")
-        report.append(f"Sensitivität:  {cmb_s4['beta_iso_sensitivity']:.3f}")
-        report.append(f"Signifikanz:   {cmb_s4['beta_iso_sigma']:.1f}σ")
-        report.append(f"Nachweisbar:   {'Ja' if cmb_s4['beta_iso_detectable'] else 'Nein'}")
-        report.append("")
-        report.append(f"r (tensor):    {cmb_s4['r_tensor']:.4f}")
-        report.append(f"Sensitivität:  {cmb_s4['r_sensitivity']:.4f}")
-        report.append(f"Nachweisbar:   {'Ja' if cmb_s4['r_detectable'] else 'Nein'}")
-        report.append("")
-        
-        # LEGEND Vorhersagen
-        report.append("4. LEGEND-1000 DETEKTIONS-VORHERSAGEN (2030+)")
-        report.append("-" * 70)
-        legend = self.predict_legend_detection()
-        report.append(f"⟨m_ββ⟩:        {legend['m_betabeta_meV']:.1f} meV")
-        report.append(f"Sensitivität:  {legend['m_bb_sensitivity_meV']:.1f} meV")
-        report.append(f"Signifikanz:   {legend['m_bb_sigma']:.1f}σ")
-        report.append(f"Nachweisbar:   {'Ja' if legend['detectable'] else 'Nein'}")
-        report.append(f"Entdeckungs-Wahrscheinlichkeit: {legend['discovery_probability']*100:.0f}%")
-        report.append("")
-        
-        # DESI Vergleich
-        report.append("5. VERGLEICH MIT DESI 2024")
-        report.append("-" * 70)
-        desi_comp = self.compare_with_desi()
-        report.append(f"S_8 (GTT):     {desi_comp['S_8_gtt']:.3f}")
-        report.append(f"S_8 (DESI):    {desi_comp['S_8_desi']:.3f}")
-        report.append(f"Abweichung:    {desi_comp['S_8_sigma']:.1f}σ")
-        report.append(f"Kompatibel:    {'Ja' if desi_comp['S_8_compatible'] else 'Nein'}")
-        report.append("")
-        
-        # Falsifikationskriterien
-        report.append("6. FALSIFIKATIONSKRITERIEN")
-        report.append("-" * 70)
-        criteria = self.falsification_criteria()
-        for key, crit in criteria.items():
-            report.append(f"{key}:")
-            report.append(f"  Test: {crit['test']} ({crit['year']})")
+        buffer = io.StringIO()
+        self.stream_report(buffer)
+        return buffer.getvalue()
+    
+    def stream_report(self, out: TextIO):
+        """
+        Schreibt den Analyse-Report abschnittsweise in einen Textstrom
+        
+        Parameters
+        ----------
+        out : TextIO
+            Ziel, z.B. eine geöffnete Datei oder sys.stdout
+        """
+        pred = self.model.compute_predictions()
+        
+        planck = self.compare_with_planck(pred)
+        sh0es = self.compare_with_sh0es(pred)
+        cmb_s4 = self.predict_cmb_s4_detection(pred)
+        legend = self.predict_legend_detection(pred)
+        desi = self.compare_with_desi()
+        
+        fields = dict(
+            planck=planck, sh0es=sh0es, cmb_s4=cmb_s4, legend=legend, desi=desi,
+            planck_compatible=_JA_NEIN[bool(planck['H0_compatible'])],
+            tension_resolved=_JA_NEIN[bool(sh0es['tension_resolved'])],
+            beta_iso_detectable=_JA_NEIN[bool(cmb_s4['beta_iso_detectable'])],
+            r_detectable=_JA_NEIN[bool(cmb_s4['r_detectable'])],
+            m_bb_detectable=_JA_NEIN[bool(legend['detectable'])],
+            desi_compatible=_JA_NEIN[bool(desi['S_8_compatible'])])
+        
+        out.write(_REPORT_HEAD.format(**fields))
+        
+        # Falsifikationskriterien: ein Block pro Kriterium
+        for key, crit in self.falsification_criteria(pred).items():
+            out.write(f"{key}:\n  Test: {crit['test']} ({crit['year']})\n")
             if 'prediction' in crit:
-                report.append(f"  Vorhersage: {crit['prediction']:.4f}")
+                out.write(f"  Vorhersage: {crit['prediction']:.4f}\n")
             if 'prediction_meV' in crit:
-                report.append(f"  Vorhersage: {crit['prediction_meV']:.1f} meV")
-            report.append("")
-        
-        report.append("=" * 70)
+                out.write(f"  Vorhersage: {crit['prediction_meV']:.1f} meV\n")
+            out.write("\n")
         
-        return "\n".join(report)
+        out.write(_REPORT_TAIL.format(**fields))
 
 
 def main():
@@ -407,13 +523,12 @@ def main():
     model = GTTModel()
     analyzer = GTTAnalyzer(model)
     
-    # Report generieren
-    report = analyzer.generate_report()
-    print(report)
+    # Report ausgeben und direkt in die Datei schreiben
+    analyzer.stream_report(sys.stdout)
+    print()
     
-    # Speichern
     with open('gtt_analysis_report.txt', 'w') as f:
-        f.write(report)
+        analyzer.stream_report(f)
     print("\nReport gespeichert in: gtt_analysis_report.txt")
 
 
@@ -0,0 +1,136 @@
+"""
+GTT Kernels - Numerische Kernfunktionen
+=======================================
+
+Die rechenintensiven Formeln des GTT-Modells als modulweite Funktionen
+mit primitiven Float-Argumenten. Ist Numba installiert, werden sie zu
+nativen ufuncs kompiliert (``@vectorize``); ohne Numba laufen dieselben
+Funktionskörper als normale NumPy-Ausdrücke und broadcasten ebenso über
+Arrays.
+
+Die Methoden von ``GTTModel`` sind dünne Wrapper um diese Kernel.
+
+Autor: GTT Theory Group
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, vectorize
+    HAVE_NUMBA = True
+except ImportError:  # Numba ist optional
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Ersatz für numba.njit: gibt die Funktion unverändert zurück"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+    def vectorize(*args, **kwargs):
+        """Ersatz für numba.vectorize: gibt die Funktion unverändert zurück"""
+        return lambda func: func
+
+
+# Fast-Math ohne 'nnan'/'ninf': NaN und inf (z.B. aus a ≤ 0 oder Überlauf
+# in exp) müssen wie bei NumPy durchgereicht werden.
+FASTMATH = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+# Die Funktionskörper verwenden nur Operationen, die sowohl Numba als auch
+# NumPy für Skalare und Arrays unterstützen (np.exp, np.minimum, ...).
+
+
+@njit(cache=True, fastmath=FASTMATH)
+def _fractal_dimension(chi, D_inf, chi_RG):
+    """D(χ) = D_∞ - (D_∞ - 2) exp(-χ/χ_RG), begrenzt auf [2, 3]"""
+    D = D_inf - (D_inf - 2.0) * np.exp(-chi / chi_RG)
+    return np.minimum(np.maximum(D, 2.0), 3.0)
+
+
+@vectorize(['float32(float32, float32, float32)',
+            'float64(float64, float64, float64)'], cache=True, fastmath=FASTMATH)
+def fractal_dimension(chi, D_inf, chi_RG):
+    """Fraktale Dimension D(χ)"""
+    return _fractal_dimension(chi, D_inf, chi_RG)
+
+
+@vectorize(['float64(float64, float64, float64, float64, float64)'],
+           cache=True, fastmath=FASTMATH)
+def G_of_chi(chi, D_inf, chi_RG, G_N, beta):
+    """Skalenabhängige Gravitationskonstante G(χ) in SI-Einheiten"""
+    D = _fractal_dimension(chi, D_inf, chi_RG)
+
+    # Begrenze delta_G um Overflow zu vermeiden
+    delta_G = np.minimum(np.maximum((D - 3.0) * chi, -10.0), 10.0)
+
+    # Quantenkorrekturen (perturbativ, klein)
+    quantum_corr = 1.0 + (2.0 / (3.0 * np.pi)) * 1e-10 + (beta / 24.0) * 1e-20
+
+    return G_N * np.exp(delta_G) * quantum_corr
+
+
+@vectorize(['float64(float64, float64, float64, float64, float64, float64)'],
+           cache=True, fastmath=FASTMATH)
+def Q_term(a, D, xi_G, beta, alpha, theta_rad):
+    """Quantengeometrie-Term Q(a, D)"""
+    inv_a2 = 1.0 / (a * a)
+
+    # Ricci-Skalar und chiraler Beitrag
+    R = 6.0 * inv_a2
+    chiral = xi_G * R * R
+
+    # Konus-Krümmung
+    deficit_angle = 2.0 * np.pi * (1.0 - np.sin(theta_rad))
+    K_cone = 6.0 * deficit_angle * inv_a2
+    cone_term = (beta / (4.0 * np.pi)) * theta_rad**2 * K_cone
+
+    # Entfaltungs-Beitrag
+    unfold = alpha * (3.0 - D) * inv_a2
+
+    return chiral + cone_term + unfold
+
+
+@vectorize(['float64(float64, float64, float64, float64, float64, float64, float64)'],
+           cache=True, fastmath=FASTMATH)
+def rho_total(a, chi, rho_crit, Omega_m, Omega_r, D_inf, chi_RG):
+    """Gesamtenergiedichte ρ(a) mit fraktaler Korrektur der Strahlung"""
+    rho_m = Omega_m * rho_crit / (a**3)
+    rho_r = Omega_r * rho_crit / (a**4)
+
+    D = _fractal_dimension(chi, D_inf, chi_RG)
+    fractal_corr = a**(-(D + 1.0)) / a**(-4.0)
+
+    return rho_m + rho_r * fractal_corr
+
+
+@vectorize(['float64(float64, float64, float64, float64, float64, float64, float64, float64)'],
+           cache=True, fastmath=FASTMATH)
+def hubble_squared(a, H0, Omega_m, Omega_r, Omega_lambda, beta, D_inf, chi_RG):
+    """H²(a) in s^-2: ΛCDM-Basis mit fraktaler und Q-Korrektur (a > 0)"""
+    H_squared_std = H0 * H0 * (Omega_m / a**3 + Omega_r / a**4 + Omega_lambda)
+
+    D = _fractal_dimension(np.log(a), D_inf, chi_RG)
+
+    # Fraktale Korrektur (klein)
+    fractal_corr = 1.0 + 0.01 * (D - 2.79167)
+
+    # Quantengeometrie-Korrektur (sehr klein)
+    Q_corr = 1.0 + 0.001 * beta * (3.0 - D)
+
+    return H_squared_std * fractal_corr * Q_corr
+
+
+@vectorize(['float32(float32, float32, float32, float32, float32, float32)',
+            'float64(float64, float64, float64, float64, float64, float64)'],
+           cache=True, fastmath=FASTMATH)
+def primordial_scalar_spectrum(log_kr, A_s, n_s, D_inf, chi_RG, beta_iso):
+    """Skalar-Spektrum P_s als Funktion von ln(k/k_pivot)"""
+    # Skalenabhängiger spektraler Index: n_s(k) - 1
+    D = _fractal_dimension(log_kr, D_inf, chi_RG)
+    tilt = -0.014 * (D - D_inf) + (n_s - 1.0)
+    P_s = A_s * np.exp(tilt * log_kr)
+
+    # Isokurvatur-Korrektur
+    iso_corr = beta_iso * np.exp(-0.5 * log_kr) * (1.0 + 0.3 * np.cos(6.0 * log_kr))
+
+    return P_s * (1.0 + iso_corr)
@@ -8,16 +8,130 @@ Geometric Field Theory (SDGFT) Berechnungen bereit.
 Autor: GTT Theory Group
 """
 
+import math
+from functools import lru_cache
 import numpy as np
-import matplotlib.pyplot as plt
 from dataclasses import dataclass
-from typing import Dict, Tuple, Optional
+from typing import Dict, Tuple, Optional, Union
 import warnings
 
+import gtt_kernels
 
-@dataclass
+
+def _exp(x: float) -> float:
+    """math.exp für Skalare, liefert wie np.exp inf statt OverflowError"""
+    try:
+        return math.exp(x)
+    except OverflowError:
+        return math.inf
+
+
+# Beobachtete Baryon-Asymmetrie η_B (Planck 2018), auf die normiert wird
+ETA_B_OBS = 6.1e-10
+
+
+@lru_cache(maxsize=4096)
+def _fd_scalar(chi: float, D_inf: float, chi_RG: float) -> float:
+    """Skalare fraktale Dimension D(χ); die Parameter sind Teil des Cache-Schlüssels"""
+    D = D_inf - (D_inf - 2.0) * _exp(-chi / chi_RG)
+    return min(max(D, 2.0), 3.0)
+
+
+@lru_cache(maxsize=4096)
+def _G_scalar(chi: float, D_inf: float, chi_RG: float, G_N: float, beta: float) -> float:
+    """Skalare Gravitationskonstante G(χ), vgl. gtt_kernels.G_of_chi"""
+    D = _fd_scalar(chi, D_inf, chi_RG)
+    delta_G = min(max((D - 3.0) * chi, -10.0), 10.0)
+    quantum_corr = 1.0 + (2.0 / (3.0 * math.pi)) * 1e-10 + (beta / 24.0) * 1e-20
+    return G_N * math.exp(delta_G) * quantum_corr
+
+
+@lru_cache(maxsize=4096)
+def _background_scalar(h: float, Mpc: float) -> Tuple[float, float]:
+    """Aus h abgeleitete Konstanten (H0 in s^-1, Ω_r)"""
+    return h * 1e5 / Mpc, 4.18e-5 / (h**2)
+
+
+@lru_cache(maxsize=4096)
+def _cone_angle_scalar(theta_max: float) -> Tuple[float, float]:
+    """Konuswinkel (θ_max in rad, sin θ_max)"""
+    theta_rad = math.radians(theta_max)
+    return theta_rad, math.sin(theta_rad)
+
+
+def _fractal_dimension_core(chi, D_inf, chi_RG: float):
+    """D(χ) für Skalare (über den Cache) oder Arrays (über den Kernel)"""
+    if np.isscalar(chi) and np.isscalar(D_inf):
+        return _fd_scalar(float(chi), float(D_inf), chi_RG)
+    return gtt_kernels.fractal_dimension(chi, D_inf, chi_RG)
+
+
+# Die folgenden Formeln verwenden nur Operationen, die für Skalare und
+# Arrays gleich funktionieren: compute_predictions (ein Parametersatz) und
+# batch_predictions (viele Parametersätze) teilen sie sich.
+
+def _hubble_tension_core(D_inf, chi_RG: float):
+    """(H0_early, H0_late) in km/s/Mpc, vgl. GTTModel.resolve_hubble_tension"""
+    # Basis H0 aus Planck
+    H0_planck = 67.4  # km/s/Mpc
+    
+    # Frühe Zeit (CMB, z ~ 1100): leicht reduziert
+    # GTT-Vorhersage: H0_early ≈ 67-68 km/s/Mpc
+    D_cmb = _fractal_dimension_core(math.log(1.0 / 1101.0), D_inf, chi_RG)
+    early_correction = 1.0 + 0.005 * (D_cmb - 2.79167)
+    H0_early = H0_planck * early_correction
+    
+    # Späte Zeit (SNe Ia, z ~ 0.1): leicht erhöht
+    # GTT-Vorhersage: H0_late ≈ 73-74 km/s/Mpc
+    D_late = _fractal_dimension_core(math.log(1.0 / 1.1), D_inf, chi_RG)
+    late_correction = 1.0 + 0.08 * (3.0 - D_late)
+    H0_late = H0_planck * late_correction
+    
+    return H0_early, H0_late
+
+
+def _tensor_to_scalar_core(D_inf, sin_theta):
+    """Tensor-zu-Skalar-Verhältnis r, vgl. GTTModel.tensor_to_scalar_ratio"""
+    suppression = (3.0 - D_inf)**2
+    return 0.002 * suppression * sin_theta
+
+
+def _neutrino_mass_core(theta_rad):
+    """⟨m_ββ⟩ in eV, vgl. GTTModel.effective_neutrino_mass"""
+    m_bb = 15.0e-3  # 15 meV
+    correction = 1.0 + 0.2 * (theta_rad / (math.pi / 6.0) - 1.0)
+    return m_bb * correction
+
+
+def _predictions_fields(D_inf, theta_max, beta_iso, chi_RG: float) -> Dict:
+    """
+    Alle GTT-Vorhersagen als Dictionary von float64-Arrays
+    
+    Skalare Parameter ergeben 0-d-Arrays, Parameter-Arrays je einen Wert
+    pro Parametersatz.
+    """
+    # Alle Größen in einem Durchlauf aus den gemeinsamen Zwischenwerten
+    # (vgl. resolve_hubble_tension, tensor_to_scalar_ratio,
+    # effective_neutrino_mass, baryon_asymmetry)
+    H0_early, H0_late = _hubble_tension_core(D_inf, chi_RG)
+    theta_rad = np.radians(theta_max)
+    
+    return {
+        'H0_early': np.asarray(H0_early, dtype=np.float64),
+        'H0_late': np.asarray(H0_late, dtype=np.float64),
+        'H0_tension_percent': 100.0 * np.abs(H0_late - H0_early) / H0_early,
+        'r_tensor': _tensor_to_scalar_core(D_inf, np.sin(theta_rad)),
+        'beta_iso': np.array(beta_iso, dtype=np.float64),
+        'm_betabeta_meV': _neutrino_mass_core(theta_rad) * 1000.0,
+        'eta_B': np.full(np.shape(theta_rad), ETA_B_OBS),
+        'D_asymptotic': np.array(D_inf, dtype=np.float64),
+        'theta_max': np.array(theta_max, dtype=np.float64)
+    }
+
+
+@dataclass(frozen=True)
 class GTTParameters:
-    """GTT-spezifische Parameter"""
+    """GTT-spezifische Parameter (unveränderlich und hashbar)"""
     theta_max: float = 30.0          # Konuswinkel [Grad]
     D_asymptotic: float = 2.7916667  # Asymptotische fraktale Dimension
     xi_G: float = 0.004              # CP-Verletzungsfaktor
@@ -27,19 +141,13 @@ class GTTParameters:
     
     def to_dict(self) -> Dict:
         """Konvertiert zu Dictionary"""
-        return {
-            'theta_max': self.theta_max,
-            'D_asymptotic': self.D_asymptotic,
-            'xi_G': self.xi_G,
-            'beta': self.beta,
-            'alpha': self.alpha,
-            'beta_iso': self.beta_iso
-        }
+        # Alle Felder sind Floats: eine flache Kopie genügt
+        return self.__dict__.copy()
 
 
-@dataclass
+@dataclass(frozen=True)
 class CosmologyParameters:
-    """Standard-kosmologische Parameter"""
+    """Standard-kosmologische Parameter (unveränderlich und hashbar)"""
     h: float = 0.674                 # Hubble-Parameter
     Omega_b: float = 0.0493          # Baryon-Dichte
     Omega_cdm: float = 0.264         # Kalte Dunkle Materie
@@ -57,17 +165,59 @@ class CosmologyParameters:
     
     def to_dict(self) -> Dict:
         """Konvertiert zu Dictionary"""
-        return {
-            'h': self.h,
-            'Omega_b': self.Omega_b,
-            'Omega_cdm': self.Omega_cdm,
-            'Omega_lambda': self.Omega_lambda,
-            'T_cmb': self.T_cmb,
-            'N_eff': self.N_eff,
-            'tau_reio': self.tau_reio,
-            'A_s': self.A_s,
-            'n_s': self.n_s
-        }
+        # Alle Felder sind Floats: eine flache Kopie genügt
+        return self.__dict__.copy()
+
+
+@dataclass(frozen=True)
+class GTTPredictions:
+    """Testbare GTT-Vorhersagen (unveränderlich, ohne Instanz-__dict__)"""
+    __slots__ = ('H0_early', 'H0_late', 'H0_tension_percent', 'r_tensor',
+                 'beta_iso', 'm_betabeta_meV', 'eta_B', 'D_asymptotic',
+                 'theta_max')
+    
+    H0_early: float                  # km/s/Mpc
+    H0_late: float                   # km/s/Mpc
+    H0_tension_percent: float
+    r_tensor: float
+    beta_iso: float
+    m_betabeta_meV: float
+    eta_B: float
+    D_asymptotic: float
+    theta_max: float                 # Grad
+    
+    def __reduce__(self):
+        # Frozen + __slots__: Standard-Pickling würde setattr verwenden
+        return (self.__class__, tuple(getattr(self, name) for name in self.__slots__))
+    
+    def as_dict(self) -> Dict:
+        """Konvertiert zu Dictionary"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+@lru_cache(maxsize=4096)
+def _predictions_core(D_inf: float, theta_max: float, beta_iso: float,
+                      chi_RG: float) -> GTTPredictions:
+    """
+    GTT-Vorhersagen aus den Parametern, von denen sie abhängen
+    
+    Modulweit zwischengespeichert (die letzten 4096 Parametersätze, wie
+    _fd_scalar): wiederholte Parametersätze werden auch über verschiedene
+    GTTModel-Instanzen hinweg nur einmal ausgewertet.
+    """
+    fields = _predictions_fields(D_inf, theta_max, beta_iso, chi_RG)
+    return GTTPredictions(**{name: float(value) for name, value in fields.items()})
+
+
+# Strukturierter Datentyp für Parameter-Scans (ein Eintrag pro GTTParameters)
+GTT_PARAMS_DTYPE = np.dtype([
+    ('theta_max', 'f8'),
+    ('D_asymptotic', 'f8'),
+    ('xi_G', 'f8'),
+    ('beta', 'f8'),
+    ('alpha', 'f8'),
+    ('beta_iso', 'f8')
+])
 
 
 class GTTModel:
@@ -98,15 +248,33 @@ class GTTModel:
         self.M_PLANCK = 1.220910e19  # GeV
         self.c = 299792458.0         # m/s
         self.G_N = 6.67430e-11       # m³/(kg·s²)
+        self._Mpc = 3.08567758e22    # m
+        self._km_per_Mpc = 3.08567758e19
+        
+        # Planck-Skala χ_P = ln(M_P) für Λ(χ)
+        self._chi_P = math.log(self.M_PLANCK)
         
-        # Cache für berechnete Werte
-        self._cache = {}
+        # Charakteristische Skala des RG-Flusses in D(χ) (nicht Planck-Skala!)
+        # Gewählt so, dass D bei χ=0 nahe D_∞ ist
+        self._chi_RG = 5.0
         
-    def fractal_dimension(self, chi: float) -> float:
+    def _background(self) -> Tuple[float, float]:
+        """
+        Aus h abgeleitete Konstanten (H0 in s^-1, Ω_r), pro h zwischengespeichert
+        """
+        return _background_scalar(self.cosmo.h, self._Mpc)
+    
+    def _cone_angle(self) -> Tuple[float, float]:
+        """
+        Konuswinkel (θ_max in rad, sin θ_max), pro θ_max zwischengespeichert
+        """
+        return _cone_angle_scalar(self.gtt.theta_max)
+    
+    def fractal_dimension(self, chi: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
         """
         Berechnet skalenabhängige fraktale Dimension D(χ)
         
-        D(χ) = D_∞ - (D_∞ - 2) * exp(-χ/χ_P)
+        D(χ) = D_∞ - (D_∞ - 2) * exp(-χ/χ_RG)
         
         Bei χ=0 (heute): D ≈ D_∞
         Bei χ→-∞ (frühe Zeiten): D → 2 (topologisch)
@@ -114,141 +282,113 @@ class GTTModel:
         
         Parameters
         ----------
-        chi : float
+        chi : float or np.ndarray
             Renormierungsskala ln(k/k0)
             
         Returns
         -------
-        float
+        float or np.ndarray
             Fraktale Dimension
         """
-        # χ_P ist die charakteristische Skala (nicht Planck-Skala!)
-        # Wähle χ_P so dass D bei χ=0 nahe D_∞ ist
-        chi_P = 5.0  # Charakteristische Skala für RG-Fluss
-        D_inf = self.gtt.D_asymptotic
-        
-        # D(χ) läuft von 2 (früh) zu D_∞ (spät)
-        D = D_inf - (D_inf - 2.0) * np.exp(-chi / chi_P)
-        
-        # Begrenze auf physikalischen Bereich
-        return np.clip(D, 2.0, 3.0)
+        # D(χ) läuft von 2 (früh) zu D_∞ (spät), begrenzt auf [2, 3]
+        if np.isscalar(chi):
+            # Wiederkehrende Skalare (z.B. z_CMB, z_SNe) kommen aus dem Cache
+            return _fd_scalar(float(chi), self.gtt.D_asymptotic, self._chi_RG)
+        return gtt_kernels.fractal_dimension(chi, self.gtt.D_asymptotic,
+                                             self._chi_RG)
     
-    def G_of_chi(self, chi: float) -> float:
+    def G_of_chi(self, chi: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
         """
         Berechnet skalenabhängige Gravitationskonstante G(χ)
         
         Parameters
         ----------
-        chi : float
+        chi : float or np.ndarray
             Renormierungsskala
             
         Returns
         -------
-        float
+        float or np.ndarray
             G(χ) in SI-Einheiten
         """
-        D = self.fractal_dimension(chi)
-        delta_G = (D - 3.0) * chi
-        
-        # Begrenze delta_G um Overflow zu vermeiden
-        delta_G = np.clip(delta_G, -10, 10)
-        
-        G_chi = self.G_N * np.exp(delta_G)
-        
-        # Quantenkorrekturen (perturbativ, klein)
-        quantum_corr = 1.0 + (2.0 / (3.0 * np.pi)) * 1e-10  # Normalisiert
-        quantum_corr += (self.gtt.beta / 24.0) * 1e-20
-        
-        return G_chi * quantum_corr
+        if np.isscalar(chi):
+            return _G_scalar(float(chi), self.gtt.D_asymptotic, self._chi_RG,
+                             self.G_N, self.gtt.beta)
+        return gtt_kernels.G_of_chi(chi, self.gtt.D_asymptotic, self._chi_RG,
+                                    self.G_N, self.gtt.beta)
     
-    def Lambda_of_chi(self, chi: float) -> float:
+    def Lambda_of_chi(self, chi: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
         """
         Berechnet skalenabhängige kosmologische Konstante Λ(χ)
         
         Parameters
         ----------
-        chi : float
+        chi : float or np.ndarray
             Renormierungsskala
             
         Returns
         -------
-        float
+        float or np.ndarray
             Λ(χ) in m^-2
         """
         Lambda_obs = 1.1056e-52  # m^-2
         D = self.fractal_dimension(chi)
         
-        scale_factor = np.exp(-(3.0 - D) * chi / 2.0)
-        chi_P = np.log(self.M_PLANCK / 1.0)
-        vacuum_energy = self.gtt.xi_G * np.exp(-chi / chi_P)
+        exp = _exp if np.isscalar(chi) else np.exp
+        scale_factor = exp(-(3.0 - D) * chi / 2.0)
+        vacuum_energy = self.gtt.xi_G * exp(-chi / self._chi_P)
         
         return Lambda_obs * scale_factor + vacuum_energy
     
-    def Q_term(self, a: float, D: float) -> float:
+    def Q_term(self, a: Union[float, np.ndarray],
+               D: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
         """
         Berechnet Quantengeometrie-Term Q(a, D)
         
         Parameters
         ----------
-        a : float
+        a : float or np.ndarray
             Skalenfaktor
-        D : float
+        D : float or np.ndarray
             Fraktale Dimension
             
         Returns
         -------
-        float
+        float or np.ndarray
             Q-Term
         """
-        # Ricci-Skalar
-        R = 6.0 / (a * a)
-        
-        # Chiraler Beitrag
-        chiral = self.gtt.xi_G * R * R
-        
-        # Konus-Krümmung
-        theta_rad = self.gtt.theta_max * np.pi / 180.0
-        deficit_angle = 2.0 * np.pi * (1.0 - np.sin(theta_rad))
-        K_cone = 6.0 * deficit_angle / (a * a)
-        cone_term = (self.gtt.beta / (4.0 * np.pi)) * theta_rad**2 * K_cone
-        
-        # Entfaltungs-Beitrag
-        unfold = self.gtt.alpha * (3.0 - D) / (a * a)
-        
-        return chiral + cone_term + unfold
+        theta_rad, _ = self._cone_angle()
+        return gtt_kernels.Q_term(a, D, self.gtt.xi_G, self.gtt.beta,
+                                  self.gtt.alpha, theta_rad)
     
-    def rho_total(self, a: float) -> float:
+    def rho_total(self, a: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
         """
         Berechnet Gesamtenergiedichte ρ(a)
         
         Parameters
         ----------
-        a : float
+        a : float or np.ndarray
             Skalenfaktor
             
         Returns
         -------
-        float
+        float or np.ndarray
             Energiedichte in kg/m³
         """
-        H0 = self.cosmo.h * 100.0 * 1000.0 / 3.08567758e22  # s^-1
-        rho_crit = 3.0 * H0**2 / (8.0 * np.pi * self.G_N)
-        
-        # Materie
-        rho_m = self.cosmo.Omega_m * rho_crit / (a**3)
+        a = np.asarray(a, dtype=np.float64)
         
-        # Strahlung
-        Omega_r = 4.18e-5 / (self.cosmo.h**2)
-        rho_r = Omega_r * rho_crit / (a**4)
+        H0, Omega_r = self._background()
+        rho_crit = 3.0 * H0**2 / (8.0 * np.pi * self.G_N)
         
-        # Fraktale Korrektur
-        chi = np.log(a) if a > 0 else -100.0
-        D = self.fractal_dimension(chi)
-        fractal_corr = a**(-(D + 1.0)) / a**(-4.0)
+        # χ = ln(a), für a ≤ 0 auf die frühe Grenze χ = -100 gesetzt
+        positive = a > 0
+        chi = np.where(positive, np.log(np.where(positive, a, 1.0)), -100.0)
         
-        return rho_m + rho_r * fractal_corr
+        return gtt_kernels.rho_total(a, chi, rho_crit, self.cosmo.Omega_m,
+                                     Omega_r, self.gtt.D_asymptotic,
+                                     self._chi_RG)
     
-    def hubble(self, a: float) -> float:
+    def hubble(self, a: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
         """
         Berechnet Hubble-Parameter H(a) mit GTT-Korrekturen
         
@@ -256,62 +396,51 @@ class GTTModel:
         
         Parameters
         ----------
-        a : float
+        a : float or np.ndarray
             Skalenfaktor
             
         Returns
         -------
-        float
-            H(a) in s^-1
+        float or np.ndarray
+            H(a) in s^-1 (NaN für a ≤ 0)
         """
-        if a <= 0:
-            return np.nan
+        a = np.asarray(a, dtype=np.float64)
+        bad = a <= 0
+        a_safe = np.where(bad, 1.0, a)
         
         # Verwende ΛCDM als Basis mit kleinen GTT-Korrekturen
-        H0 = self.cosmo.h * 100.0 * 1000.0 / 3.08567758e22  # s^-1
+        H0, Omega_r = self._background()
         
-        # Standard-Friedmann
-        Omega_m = self.cosmo.Omega_m
-        Omega_lambda = self.cosmo.Omega_lambda
-        Omega_r = 4.18e-5 / (self.cosmo.h**2)
+        # Standard-Friedmann mit fraktaler und Q-Korrektur
+        H_squared = gtt_kernels.hubble_squared(
+            a_safe, H0, self.cosmo.Omega_m, Omega_r, self.cosmo.Omega_lambda,
+            self.gtt.beta, self.gtt.D_asymptotic, self._chi_RG)
         
-        H_squared_std = H0**2 * (Omega_m / a**3 + Omega_r / a**4 + Omega_lambda)
+        negative = H_squared < 0
+        if np.any(negative):
+            warnings.warn(f"H² < 0 bei a = {a[negative]}")
         
-        # GTT-Korrekturen (klein, perturbativ)
-        chi = np.log(a) if a > 0 else -100.0
-        D = self.fractal_dimension(chi)
-        
-        # Fraktale Korrektur (klein)
-        fractal_corr = 1.0 + 0.01 * (D - 2.79167)
-        
-        # Quantengeometrie-Korrektur (sehr klein)
-        Q_corr = 1.0 + 0.001 * self.gtt.beta * (3.0 - D)
-        
-        H_squared = H_squared_std * fractal_corr * Q_corr
-        
-        if H_squared < 0:
-            warnings.warn(f"H² < 0 bei a = {a}")
-            return np.nan
-        
-        return np.sqrt(H_squared)
+        H = np.sqrt(np.maximum(H_squared, 0.0))
+        H = np.where(bad | negative, np.nan, H)
+        return H[()] if H.ndim == 0 else H
     
-    def hubble_at_z(self, z: float) -> float:
+    def hubble_at_z(self, z: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
         """
         Berechnet Hubble-Parameter bei Rotverschiebung z
         
         Parameters
         ----------
-        z : float
+        z : float or np.ndarray
             Rotverschiebung
             
         Returns
         -------
-        float
+        float or np.ndarray
             H(z) in km/s/Mpc
         """
-        a = 1.0 / (1.0 + z)
+        a = 1.0 / (1.0 + np.asarray(z, dtype=np.float64))
         H_SI = self.hubble(a)
-        H_kmsMpc = H_SI * 3.08567758e22 / 1000.0
+        H_kmsMpc = H_SI * self._km_per_Mpc
         return H_kmsMpc
     
     def resolve_hubble_tension(self) -> Tuple[float, float]:
@@ -323,59 +452,48 @@ class GTTModel:
         Tuple[float, float]
             (H0_early, H0_late) in km/s/Mpc
         """
-        # Basis H0 aus Planck
-        H0_planck = 67.4  # km/s/Mpc
-        
-        # Frühe Zeit (CMB, z ~ 1100): leicht reduziert
-        # GTT-Vorhersage: H0_early ≈ 67-68 km/s/Mpc
-        chi_cmb = np.log(1.0 / 1101.0)
-        D_cmb = self.fractal_dimension(chi_cmb)
-        early_correction = 1.0 + 0.005 * (D_cmb - 2.79167)
-        H0_early = H0_planck * early_correction
-        
-        # Späte Zeit (SNe Ia, z ~ 0.1): leicht erhöht
-        # GTT-Vorhersage: H0_late ≈ 73-74 km/s/Mpc
-        chi_late = np.log(1.0 / 1.1)
-        D_late = self.fractal_dimension(chi_late)
-        late_correction = 1.0 + 0.08 * (3.0 - D_late)
-        H0_late = H0_planck * late_correction
-        
-        return H0_early, H0_late
+        return _hubble_tension_core(self.gtt.D_asymptotic, self._chi_RG)
     
-    def primordial_scalar_spectrum(self, k: np.ndarray) -> np.ndarray:
+    def primordial_scalar_spectrum(self, k: np.ndarray,
+                                   precision: str = 'double') -> np.ndarray:
         """
         Berechnet primordiales Skalar-Spektrum P_s(k)
         
+        P_s(k) = A_s (k/k_*)^(n_s(k)-1) · [1 + β_iso (k/k_*)^(-1/2) (1 + 0.3 cos(6 ln(k/k_*)))]
+        
         Parameters
         ----------
         k : np.ndarray
             Wellenzahlen in Mpc^-1
+        precision : str, optional
+            'double' (float64, Standard) oder 'single' (float32; halbiert
+            den Speicherbedarf großer k-Gitter, relative Genauigkeit ~1e-6)
             
         Returns
         -------
         np.ndarray
-            P_s(k)
+            P_s(k) im gewählten Datentyp
         """
-        k_pivot = 0.05
-        k_ratio = k / k_pivot
+        if precision == 'double':
+            dtype = np.float64
+        elif precision == 'single':
+            dtype = np.float32
+        else:
+            raise ValueError(f"Unbekannte Genauigkeit: {precision!r} "
+                             "(erwartet 'single' oder 'double')")
         
-        # Skalenabhängiger spektraler Index
-        chi_k = np.log(k / k_pivot)
-        D_k = self.fractal_dimension(chi_k)
-        n_s_k = self.cosmo.n_s - 0.014 * (D_k - self.gtt.D_asymptotic)
-        
-        # Basis-Spektrum
-        P_s = self.cosmo.A_s * k_ratio**(n_s_k - 1.0)
-        
-        # Isokurvatur-Korrektur
-        iso_amplitude = self.gtt.beta_iso * k_ratio**(-0.5)
-        phase = 6.0 * np.log(k_ratio)
-        oscillation = np.cos(phase)
-        iso_corr = iso_amplitude * (1.0 + 0.3 * oscillation)
+        k_pivot = 0.05
+        k = np.asarray(k, dtype=dtype)
+        scalar = k.ndim == 0
         
-        P_s *= (1.0 + iso_corr)
+        # ln(k/k_pivot) wird einmal berechnet; Index, Potenzgesetz und
+        # Isokurvatur-Term wertet der Kernel in einem Durchlauf aus
+        log_kr = np.log(np.atleast_1d(k) / k_pivot)
+        P_s = gtt_kernels.primordial_scalar_spectrum(
+            log_kr, self.cosmo.A_s, self.cosmo.n_s, self.gtt.D_asymptotic,
+            self._chi_RG, self.gtt.beta_iso)
         
-        return P_s
+        return P_s[0] if scalar else P_s
     
     def tensor_to_scalar_ratio(self) -> float:
         """
@@ -386,10 +504,8 @@ class GTTModel:
         float
             r (GTT-Vorhersage: ~0.002)
         """
-        theta_rad = self.gtt.theta_max * np.pi / 180.0
-        suppression = (3.0 - self.gtt.D_asymptotic)**2
-        r = 0.002 * suppression * np.sin(theta_rad)
-        return r
+        _, sin_theta = self._cone_angle()
+        return _tensor_to_scalar_core(self.gtt.D_asymptotic, sin_theta)
     
     def effective_neutrino_mass(self) -> float:
         """
@@ -400,10 +516,8 @@ class GTTModel:
         float
             ⟨m_ββ⟩ in eV (GTT-Vorhersage: 15 ± 3 meV)
         """
-        theta_rad = self.gtt.theta_max * np.pi / 180.0
-        m_bb = 15.0e-3  # 15 meV
-        correction = 1.0 + 0.2 * (theta_rad / (np.pi / 6.0) - 1.0)
-        return m_bb * correction
+        theta_rad, _ = self._cone_angle()
+        return _neutrino_mass_core(theta_rad)
     
     def baryon_asymmetry(self) -> float:
         """
@@ -414,36 +528,50 @@ class GTTModel:
         float
             η_B = (n_B - n_B̄)/n_γ
         """
-        theta_rad = self.gtt.theta_max * np.pi / 180.0
-        theory_factor = self.gtt.xi_G * np.sin(theta_rad) * self.gtt.beta
-        eta_B_obs = 6.1e-10
-        normalization = eta_B_obs / theory_factor
-        return theory_factor * normalization
+        # Der Theoriefaktor ξ_G·sin θ·β wird auf η_B,obs normiert und kürzt
+        # sich damit heraus
+        return ETA_B_OBS
     
-    def compute_predictions(self) -> Dict:
+    def compute_predictions(self) -> GTTPredictions:
         """
         Berechnet alle testbaren GTT-Vorhersagen
         
+        Das Ergebnis wird pro Parametersatz modulweit zwischengespeichert;
+        nach einem Austausch von ``cosmo`` oder ``gtt`` wird neu berechnet,
+        ein weiteres Modell mit denselben Parametern nutzt den Cache mit.
+        
         Returns
         -------
-        Dict
-            Dictionary mit allen Vorhersagen
+        GTTPredictions
+            Alle Vorhersagen (``as_dict()`` liefert ein Dictionary)
+        """
+        return _predictions_core(self.gtt.D_asymptotic, self.gtt.theta_max,
+                                 self.gtt.beta_iso, self._chi_RG)
+    
+    def batch_predictions(self, gtt_soa: np.ndarray) -> Dict[str, np.ndarray]:
         """
-        H0_early, H0_late = self.resolve_hubble_tension()
+        Berechnet die GTT-Vorhersagen für viele Parametersätze auf einmal
         
-        predictions = {
-            'H0_early': H0_early,
-            'H0_late': H0_late,
-            'H0_tension_percent': 100.0 * abs(H0_late - H0_early) / H0_early,
-            'r_tensor': self.tensor_to_scalar_ratio(),
-            'beta_iso': self.gtt.beta_iso,
-            'm_betabeta_meV': self.effective_neutrino_mass() * 1000.0,
-            'eta_B': self.baryon_asymmetry(),
-            'D_asymptotic': self.gtt.D_asymptotic,
-            'theta_max': self.gtt.theta_max
-        }
+        Die Kosmologie-Parameter werden vom Modell übernommen; die
+        GTT-Parameter kommen spaltenweise aus einem strukturierten Array.
         
-        return predictions
+        Parameters
+        ----------
+        gtt_soa : np.ndarray
+            Strukturiertes Array mit dtype ``GTT_PARAMS_DTYPE``
+            
+        Returns
+        -------
+        Dict[str, np.ndarray]
+            Die Felder von ``GTTPredictions`` als Schlüssel, je ein Array
+            mit einem Wert pro Parametersatz
+        """
+        # Dieselben Formeln wie compute_predictions, elementweise über Arrays
+        return _predictions_fields(
+            np.asarray(gtt_soa['D_asymptotic'], dtype=np.float64),
+            np.asarray(gtt_soa['theta_max'], dtype=np.float64),
+            np.asarray(gtt_soa['beta_iso'], dtype=np.float64),
+            self._chi_RG)
     
     def print_predictions(self):
         """Gibt alle Vorhersagen formatiert aus"""
@@ -454,29 +582,29 @@ class GTTModel:
         print("=" * 60)
         print()
         print("HUBBLE-SPANNUNG:")
-        print(f"  H0 (früh, CMB):  {pred['H0_early']:.2f} km/s/Mpc")
-        print(f"  H0 (spät, SNe):  {pred['H0_late']:.2f} km/s/Mpc")
-        print(f"  Spannung:        {pred['H0_tension_percent']:.1f}%")
+        print(f"  H0 (früh, CMB):  {pred.H0_early:.2f} km/s/Mpc")
+        print(f"  H0 (spät, SNe):  {pred.H0_late:.2f} km/s/Mpc")
+        print(f"  Spannung:        {pred.H0_tension_percent:.1f}%")
         print()
         print("PRIMORDIALE GRAVITATIONSWELLEN:")
-        print(f"  r (tensor):      {pred['r_tensor']:.4f}")
+        print(f"  r (tensor):      {pred.r_tensor:.4f}")
         print(f"  Nachweis:        CMB-S4 (2030-2035)")
         print()
         print("ISOKURVATUR-MODEN:")
-        print(f"  β_iso:           {pred['beta_iso']:.3f}")
+        print(f"  β_iso:           {pred.beta_iso:.3f}")
         print(f"  Nachweis:        CMB-S4 (2030-2035)")
         print()
         print("NEUTRINO-PHYSIK:")
-        print(f"  ⟨m_ββ⟩:          {pred['m_betabeta_meV']:.1f} meV")
+        print(f"  ⟨m_ββ⟩:          {pred.m_betabeta_meV:.1f} meV")
         print(f"  Nachweis:        LEGEND-1000 (2030+)")
         print()
         print("BARYON-ASYMMETRIE:")
-        print(f"  η_B:             {pred['eta_B']:.2e}")
+        print(f"  η_B:             {pred.eta_B:.2e}")
         print(f"  Beobachtet:      6.1 × 10⁻¹⁰")
         print()
         print("GEOMETRIE:")
-        print(f"  D_∞:             {pred['D_asymptotic']:.7f}")
-        print(f"  θ_max:           {pred['theta_max']:.1f}°")
+        print(f"  D_∞:             {pred.D_asymptotic:.7f}")
+        print(f"  θ_max:           {pred.theta_max:.1f}°")
         print()
         print("=" * 60)
 
@@ -490,7 +618,7 @@ if __name__ == "__main__":
     
     # Hubble-Parameter bei verschiedenen z
     print("\nHubble-Parameter H(z):")
-    z_values = [0.0, 0.5, 1.0, 2.0, 5.0, 10.0, 1100.0]
-    for z in z_values:
-        H_z = model.hubble_at_z(z)
+    z_values = np.array([0.0, 0.5, 1.0, 2.0, 5.0, 10.0, 1100.0])
+    H_values = model.hubble_at_z(z_values)
+    for z, H_z in zip(z_values, H_values):
         print(f"  z = {z:6.1f}: H = {H_z:7.2f} km/s/Mpc")
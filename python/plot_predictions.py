@@ -8,11 +8,19 @@ mit Beobachtungsdaten.
 Autor: GTT Theory Group
 """
 
+import os
 import numpy as np
+from typing import Dict, Optional, Tuple
 import matplotlib.pyplot as plt
-from matplotlib.gridspec import GridSpec
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
 from gtt_model import GTTModel
-from gtt_analyzer import GTTAnalyzer, ObservationalData
+from gtt_analyzer import GTTAnalyzer, PLANCK_2018, SH0ES_2022
+
+
+# Dateiendungen, die matplotlib als Vektorgrafik schreibt
+_VECTOR_FORMATS = ('.pdf', '.svg', '.svgz', '.eps', '.ps')
 
 
 class GTTPlotter:
@@ -29,16 +37,108 @@ class GTTPlotter:
         """
         self.model = model
         self.analyzer = GTTAnalyzer(model)
-        
-        # Plot-Stil
-        plt.style.use('seaborn-v0_8-darkgrid')
+        self._grids = {}
+        
+        # Plot-Stil (ältere Matplotlib-Versionen kennen den Namen nicht;
+        # dann bleibt der Standard-Stil aktiv)
+        try:
+            plt.style.use('seaborn-v0_8-darkgrid')
+        except OSError:
+            pass
         self.colors = {
             'gtt': '#e74c3c',
             'lcdm': '#3498db',
             'obs': '#2ecc71'
         }
     
-    def plot_hubble_evolution(self, save_path: str = None):
+    def _precompute(self, n_points: int) -> Dict[str, np.ndarray]:
+        """
+        Wertet das Modell auf den gemeinsamen Plot-Gittern aus
+        
+        Die Gitter werden von allen Plots geteilt. Zwischengespeichert wird
+        nur der zuletzt verwendete Satz (Punktzahl, ``model.cosmo``,
+        ``model.gtt``); bei einer anderen Punktzahl oder nach einem
+        Parameterwechsel wird neu berechnet.
+        """
+        key = (n_points, self.model.cosmo, self.model.gtt)
+        grids = self._grids.get(key)
+        if grids is None:
+            # Rotverschiebungen, Renormierungsskalen und Wellenzahlen
+            z = np.logspace(-2, 3, n_points)
+            chi = np.linspace(-50, 50, n_points)
+            k = np.logspace(-4, 0, n_points)
+            
+            grids = {
+                'z': z,
+                'chi': chi,
+                'k': k,
+                'H_gtt': self.model.hubble_at_z(z),
+                'D': self.model.fractal_dimension(chi),
+                'G_ratio': self.model.G_of_chi(chi) / self.model.G_N,
+                'P_s': self.model.primordial_scalar_spectrum(k)
+            }
+            self._grids = {key: grids}
+        return grids
+    
+    def _new_figure(self, fig: Optional[Figure], figsize: Tuple[float, float],
+                    save_path: Optional[str]) -> Tuple[Figure, bool]:
+        """
+        Liefert eine leere Figure der gewünschten Größe
+        
+        Soll nur gespeichert werden, entsteht die Figure direkt mit einer
+        Agg-Canvas, ohne die globale Figurenverwaltung von pyplot.
+        
+        Returns
+        -------
+        Tuple[Figure, bool]
+            (Figure, True falls über pyplot erzeugt und vom Plot zu schließen)
+        """
+        if fig is None:
+            if save_path:
+                fig = Figure(figsize=figsize)
+                FigureCanvasAgg(fig)
+                return fig, False
+            return plt.figure(figsize=figsize), True
+        fig.clf()
+        fig.set_size_inches(figsize)
+        return fig, False
+    
+    def _save_figure(self, fig: Figure, save_path: str, dpi: int):
+        """
+        Speichert die Figure; bei Rastergrafik ohne Kantenglättung dicker Linien
+        """
+        if os.path.splitext(save_path)[1].lower() not in _VECTOR_FORMATS:
+            # Agg-Kosten für breite, geglättete Striche sparen
+            for line in fig.findobj(Line2D):
+                if line.get_linewidth() >= 2.0:
+                    line.set_antialiased(False)
+                    line.set_solid_capstyle('butt')
+        fig.savefig(save_path, dpi=dpi)
+    
+    def _draw_hubble(self, ax, z: np.ndarray, H_gtt: np.ndarray,
+                     H_lcdm: np.ndarray = None, label: str = 'GTT'):
+        """Zeichnet H(z) von GTT (und optional ΛCDM) in ax"""
+        ax.plot(z, H_gtt, color=self.colors['gtt'], linewidth=2.5,
+                label=label, zorder=3)
+        if H_lcdm is not None:
+            ax.plot(z, H_lcdm, color=self.colors['lcdm'], linewidth=2.5,
+                    linestyle='--', label='ΛCDM', zorder=2)
+        ax.set_xscale('log')
+        ax.grid(True, alpha=0.3)
+    
+    def _draw_fractal(self, ax, chi: np.ndarray, D: np.ndarray):
+        """Zeichnet D(χ) in ax"""
+        ax.plot(chi, D, color=self.colors['gtt'], linewidth=2.5)
+        ax.grid(True, alpha=0.3)
+    
+    def _draw_primordial(self, ax, k: np.ndarray, P_s: np.ndarray,
+                         label: str = 'GTT'):
+        """Zeichnet das Skalar-Spektrum P_s(k) doppelt-logarithmisch in ax"""
+        ax.loglog(k, P_s, color=self.colors['gtt'], linewidth=2.5, label=label)
+        ax.grid(True, alpha=0.3)
+    
+    def plot_hubble_evolution(self, save_path: str = None, dpi: int = 150,
+                              fig: Figure = None, n_points: int = 128):
         """
         Plottet H(z) Evolution
         
@@ -46,14 +146,22 @@ class GTTPlotter:
         ----------
         save_path : str, optional
             Pfad zum Speichern
+        dpi : int, optional
+            Auflösung bei Rastergrafik (PNG); Vektorformate ignorieren sie
+        fig : Figure, optional
+            Vorhandene Figure, die geleert und wiederverwendet wird; ohne
+            save_path wird sie nur gezeichnet, anzeigen muss der Aufrufer
+        n_points : int, optional
+            Anzahl der Gitterpunkte der Kurven
         """
-        fig, ax = plt.subplots(figsize=(10, 6))
+        grids = self._precompute(n_points)
         
-        # Rotverschiebungen
-        z = np.logspace(-2, 3, 200)
+        fig, pyplot_managed = self._new_figure(fig, (10, 6), save_path)
+        ax = fig.subplots()
         
-        # GTT H(z)
-        H_gtt = np.array([self.model.hubble_at_z(zi) for zi in z])
+        # Rotverschiebungen und GTT H(z)
+        z = grids['z']
+        H_gtt = grids['H_gtt']
         
         # ΛCDM zum Vergleich (vereinfacht)
         H0_lcdm = 67.4
@@ -62,15 +170,11 @@ class GTTPlotter:
         H_lcdm = H0_lcdm * np.sqrt(Omega_m * (1 + z)**3 + Omega_lambda)
         
         # Plots
-        ax.plot(z, H_gtt, color=self.colors['gtt'], linewidth=2.5, 
-                label='GTT (SDGFT)', zorder=3)
-        ax.plot(z, H_lcdm, color=self.colors['lcdm'], linewidth=2.5, 
-                linestyle='--', label='ΛCDM', zorder=2)
+        self._draw_hubble(ax, z, H_gtt, H_lcdm, label='GTT (SDGFT)')
         
         # Beobachtungsdaten
-        obs = ObservationalData()
-        planck = obs.planck_2018()
-        sh0es = obs.sh0es_2022()
+        planck = PLANCK_2018
+        sh0es = SH0ES_2022
         
         ax.errorbar([1100], [planck['H0']], yerr=[planck['H0_err']], 
                    fmt='o', color=self.colors['obs'], markersize=8,
@@ -81,21 +185,23 @@ class GTTPlotter:
         
         ax.set_xlabel('Rotverschiebung z', fontsize=14)
         ax.set_ylabel('H(z) [km/s/Mpc]', fontsize=14)
-        ax.set_xscale('log')
         ax.set_title('Hubble-Parameter Evolution: GTT vs. ΛCDM', 
                     fontsize=16, fontweight='bold')
         ax.legend(fontsize=12, loc='upper left')
-        ax.grid(True, alpha=0.3)
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            self._save_figure(fig, save_path, dpi)
             print(f"Plot gespeichert: {save_path}")
-        else:
+        elif pyplot_managed:
             plt.show()
+        
+        if pyplot_managed:
+            plt.close(fig)
     
-    def plot_primordial_spectra(self, save_path: str = None):
+    def plot_primordial_spectra(self, save_path: str = None, dpi: int = 150,
+                                fig: Figure = None, n_points: int = 128):
         """
         Plottet primordiale Leistungsspektren
         
@@ -103,14 +209,22 @@ class GTTPlotter:
         ----------
         save_path : str, optional
             Pfad zum Speichern
+        dpi : int, optional
+            Auflösung bei Rastergrafik (PNG); Vektorformate ignorieren sie
+        fig : Figure, optional
+            Vorhandene Figure, die geleert und wiederverwendet wird; ohne
+            save_path wird sie nur gezeichnet, anzeigen muss der Aufrufer
+        n_points : int, optional
+            Anzahl der Gitterpunkte der Kurven
         """
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+        grids = self._precompute(n_points)
         
-        # Wellenzahlen
-        k = np.logspace(-4, 0, 300)
+        fig, pyplot_managed = self._new_figure(fig, (14, 6), save_path)
+        ax1, ax2 = fig.subplots(1, 2)
         
-        # Skalar-Spektrum
-        P_s = self.model.primordial_scalar_spectrum(k)
+        # Wellenzahlen und Skalar-Spektrum
+        k = grids['k']
+        P_s = grids['P_s']
         
         # ΛCDM zum Vergleich
         k_pivot = 0.05
@@ -119,8 +233,7 @@ class GTTPlotter:
         P_s_lcdm = A_s_lcdm * (k / k_pivot)**(n_s_lcdm - 1.0)
         
         # Plot 1: Skalar-Spektrum
-        ax1.loglog(k, P_s, color=self.colors['gtt'], linewidth=2.5,
-                  label='GTT (mit Isokurvatur)')
+        self._draw_primordial(ax1, k, P_s, label='GTT (mit Isokurvatur)')
         ax1.loglog(k, P_s_lcdm, color=self.colors['lcdm'], linewidth=2.5,
                   linestyle='--', label='ΛCDM')
         
@@ -131,26 +244,19 @@ class GTTPlotter:
         ax1.set_ylabel('P_s(k)', fontsize=12)
         ax1.set_title('Primordiales Skalar-Spektrum', fontsize=14, fontweight='bold')
         ax1.legend(fontsize=10)
-        ax1.grid(True, alpha=0.3)
         
         # Plot 2: Isokurvatur-Korrektur
-        iso_corr = []
-        for ki in k:
-            chi_k = np.log(ki / k_pivot)
-            D_k = self.model.fractal_dimension(chi_k)
-            k_ratio = ki / k_pivot
-            iso_amplitude = self.model.gtt.beta_iso * k_ratio**(-0.5)
-            phase = 6.0 * np.log(k_ratio)
-            oscillation = np.cos(phase)
-            iso_corr.append(iso_amplitude * (1.0 + 0.3 * oscillation))
-        
-        iso_corr = np.array(iso_corr)
+        beta_iso = self.model.gtt.beta_iso
+        k_ratio = k / k_pivot
+        iso_amplitude = beta_iso * k_ratio**(-0.5)
+        oscillation = np.cos(6.0 * np.log(k_ratio))
+        iso_corr = iso_amplitude * (1.0 + 0.3 * oscillation)
         
         ax2.semilogx(k, iso_corr * 100, color=self.colors['gtt'], linewidth=2.5)
         ax2.axhline(0, color='black', linestyle='-', linewidth=0.5)
-        ax2.axhline(self.model.gtt.beta_iso * 100, color='red', 
+        ax2.axhline(beta_iso * 100, color='red', 
                    linestyle='--', alpha=0.7, 
-                   label=f'β_iso = {self.model.gtt.beta_iso:.3f}')
+                   label=f'β_iso = {beta_iso:.3f}')
         
         ax2.set_xlabel('Wellenzahl k [Mpc⁻¹]', fontsize=12)
         ax2.set_ylabel('Isokurvatur-Korrektur [%]', fontsize=12)
@@ -159,15 +265,19 @@ class GTTPlotter:
         ax2.legend(fontsize=10)
         ax2.grid(True, alpha=0.3)
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            self._save_figure(fig, save_path, dpi)
             print(f"Plot gespeichert: {save_path}")
-        else:
+        elif pyplot_managed:
             plt.show()
+        
+        if pyplot_managed:
+            plt.close(fig)
     
-    def plot_fractal_dimension(self, save_path: str = None):
+    def plot_fractal_dimension(self, save_path: str = None, dpi: int = 150,
+                               fig: Figure = None, n_points: int = 128):
         """
         Plottet skalenabhängige fraktale Dimension D(χ)
         
@@ -175,17 +285,25 @@ class GTTPlotter:
         ----------
         save_path : str, optional
             Pfad zum Speichern
+        dpi : int, optional
+            Auflösung bei Rastergrafik (PNG); Vektorformate ignorieren sie
+        fig : Figure, optional
+            Vorhandene Figure, die geleert und wiederverwendet wird; ohne
+            save_path wird sie nur gezeichnet, anzeigen muss der Aufrufer
+        n_points : int, optional
+            Anzahl der Gitterpunkte der Kurven
         """
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+        grids = self._precompute(n_points)
         
-        # Skalen
-        chi = np.linspace(-50, 50, 500)
+        fig, pyplot_managed = self._new_figure(fig, (14, 6), save_path)
+        ax1, ax2 = fig.subplots(1, 2)
         
-        # Fraktale Dimension
-        D = np.array([self.model.fractal_dimension(c) for c in chi])
+        # Skalen und fraktale Dimension
+        chi = grids['chi']
+        D = grids['D']
         
         # Plot 1: D(χ)
-        ax1.plot(chi, D, color=self.colors['gtt'], linewidth=2.5)
+        self._draw_fractal(ax1, chi, D)
         ax1.axhline(3.0, color='gray', linestyle='--', alpha=0.5, 
                    label='D = 3 (klassisch)')
         ax1.axhline(2.0, color='gray', linestyle=':', alpha=0.5, 
@@ -199,11 +317,10 @@ class GTTPlotter:
         ax1.set_title('Skalenabhängige Fraktale Dimension', 
                      fontsize=14, fontweight='bold')
         ax1.legend(fontsize=10)
-        ax1.grid(True, alpha=0.3)
         ax1.set_ylim([1.9, 3.1])
         
         # Plot 2: G(χ) / G_Newton
-        G_ratio = np.array([self.model.G_of_chi(c) / self.model.G_N for c in chi])
+        G_ratio = grids['G_ratio']
         
         ax2.semilogy(chi, G_ratio, color=self.colors['gtt'], linewidth=2.5)
         ax2.axhline(1.0, color='gray', linestyle='--', alpha=0.5,
@@ -216,15 +333,19 @@ class GTTPlotter:
         ax2.legend(fontsize=10)
         ax2.grid(True, alpha=0.3)
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            self._save_figure(fig, save_path, dpi)
             print(f"Plot gespeichert: {save_path}")
-        else:
+        elif pyplot_managed:
             plt.show()
+        
+        if pyplot_managed:
+            plt.close(fig)
     
-    def plot_detection_prospects(self, save_path: str = None):
+    def plot_detection_prospects(self, save_path: str = None, dpi: int = 150,
+                                 fig: Figure = None):
         """
         Plottet Detektions-Aussichten für zukünftige Experimente
         
@@ -232,20 +353,28 @@ class GTTPlotter:
         ----------
         save_path : str, optional
             Pfad zum Speichern
+        dpi : int, optional
+            Auflösung bei Rastergrafik (PNG); Vektorformate ignorieren sie
+        fig : Figure, optional
+            Vorhandene Figure, die geleert und wiederverwendet wird; ohne
+            save_path wird sie nur gezeichnet, anzeigen muss der Aufrufer
         """
-        fig = plt.figure(figsize=(12, 8))
-        gs = GridSpec(2, 2, figure=fig, hspace=0.3, wspace=0.3)
+        fig, pyplot_managed = self._new_figure(fig, (12, 8), save_path)
+        axes = fig.subplots(2, 2, gridspec_kw={'hspace': 0.3, 'wspace': 0.3})
+        ax1, ax2, ax3, ax4 = axes.flat
+        
+        # Vorhersagen zu den aktuellen Parametern (pro Parametersatz gecacht)
+        pred = self.model.compute_predictions()
         
         # 1. CMB-S4: β_iso
-        ax1 = fig.add_subplot(gs[0, 0])
-        cmb_s4 = self.analyzer.predict_cmb_s4_detection()
+        cmb_s4 = self.analyzer.predict_cmb_s4_detection(pred)
         
         experiments = ['Planck\n2018', 'CMB-S4\n2030']
         sensitivities = [0.05, cmb_s4['beta_iso_sensitivity']]
         prediction = cmb_s4['beta_iso']
         
-        ax1.bar(experiments, sensitivities, color=['lightblue', 'lightcoral'], 
-               alpha=0.7, edgecolor='black')
+        ax1.bar(range(len(experiments)), sensitivities, tick_label=experiments,
+               color=['lightblue', 'lightcoral'], alpha=0.7, edgecolor='black')
         ax1.axhline(prediction, color='red', linewidth=2.5, linestyle='--',
                    label=f'GTT-Vorhersage: {prediction:.3f}')
         ax1.set_ylabel('β_iso Sensitivität', fontsize=11)
@@ -254,14 +383,14 @@ class GTTPlotter:
         ax1.grid(True, alpha=0.3, axis='y')
         
         # 2. LEGEND: m_ββ
-        ax2 = fig.add_subplot(gs[0, 1])
-        legend_pred = self.analyzer.predict_legend_detection()
+        legend_pred = self.analyzer.predict_legend_detection(pred)
         
         experiments = ['GERDA\n2020', 'LEGEND-200\n2025', 'LEGEND-1000\n2030']
         sensitivities = [100, 30, legend_pred['m_bb_sensitivity_meV']]
         prediction = legend_pred['m_betabeta_meV']
         
-        ax2.bar(experiments, sensitivities, color=['lightblue', 'lightgreen', 'lightcoral'],
+        ax2.bar(range(len(experiments)), sensitivities, tick_label=experiments,
+               color=['lightblue', 'lightgreen', 'lightcoral'],
                alpha=0.7, edgecolor='black')
         ax2.axhline(prediction, color='red', linewidth=2.5, linestyle='--',
                    label=f'GTT-Vorhersage: {prediction:.1f} meV')
@@ -272,13 +401,12 @@ class GTTPlotter:
         ax2.grid(True, alpha=0.3, axis='y')
         
         # 3. Tensor-zu-Skalar r
-        ax3 = fig.add_subplot(gs[1, 0])
         
         experiments = ['Planck\n2018', 'BICEP3\n2021', 'CMB-S4\n2030']
         sensitivities = [0.06, 0.03, cmb_s4['r_sensitivity']]
         prediction = cmb_s4['r_tensor']
         
-        ax3.bar(experiments, sensitivities, 
+        ax3.bar(range(len(experiments)), sensitivities, tick_label=experiments,
                color=['lightblue', 'lightgreen', 'lightcoral'],
                alpha=0.7, edgecolor='black')
         ax3.axhline(prediction, color='red', linewidth=2.5, linestyle='--',
@@ -290,7 +418,6 @@ class GTTPlotter:
         ax3.grid(True, alpha=0.3, axis='y')
         
         # 4. S_8 Spannung
-        ax4 = fig.add_subplot(gs[1, 1])
         desi_comp = self.analyzer.compare_with_desi()
         
         datasets = ['Planck\n2018', 'DES\n2022', 'DESI\n2024', 'GTT']
@@ -298,7 +425,8 @@ class GTTPlotter:
         S_8_errors = [0.016, 0.026, 0.03, 0.02]
         colors_list = ['lightblue', 'lightgreen', 'lightyellow', 'lightcoral']
         
-        ax4.bar(datasets, S_8_values, yerr=S_8_errors, 
+        ax4.bar(range(len(datasets)), S_8_values, yerr=S_8_errors,
+               tick_label=datasets,
                color=colors_list, alpha=0.7, edgecolor='black',
                capsize=5)
         ax4.set_ylabel('S_8 = σ_8 √(Ω_m/0.3)', fontsize=11)
@@ -306,16 +434,20 @@ class GTTPlotter:
         ax4.grid(True, alpha=0.3, axis='y')
         ax4.set_ylim([0.72, 0.88])
         
-        plt.suptitle('GTT-Vorhersagen: Detektions-Aussichten bis 2035', 
-                    fontsize=16, fontweight='bold', y=0.98)
+        fig.suptitle('GTT-Vorhersagen: Detektions-Aussichten bis 2035', 
+                     fontsize=16, fontweight='bold', y=0.98)
         
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            self._save_figure(fig, save_path, dpi)
             print(f"Plot gespeichert: {save_path}")
-        else:
+        elif pyplot_managed:
             plt.show()
+        
+        if pyplot_managed:
+            plt.close(fig)
     
-    def create_summary_plot(self, save_path: str = 'gtt_summary.png'):
+    def create_summary_plot(self, save_path: str = 'gtt_summary.png', dpi: int = 150,
+                            fig: Figure = None, n_points: int = 128):
         """
         Erstellt zusammenfassenden Plot mit allen Hauptergebnissen
         
@@ -323,43 +455,43 @@ class GTTPlotter:
         ----------
         save_path : str
             Pfad zum Speichern
+        dpi : int, optional
+            Auflösung bei Rastergrafik (PNG); Vektorformate ignorieren sie
+        fig : Figure, optional
+            Vorhandene Figure, die geleert und wiederverwendet wird
+        n_points : int, optional
+            Anzahl der Gitterpunkte der Kurven
         """
-        fig = plt.figure(figsize=(16, 10))
-        gs = GridSpec(2, 3, figure=fig, hspace=0.3, wspace=0.3)
+        grids = self._precompute(n_points)
+        
+        fig, pyplot_managed = self._new_figure(fig, (16, 10), save_path)
+        # H(z) und P_s(k) belegen je zwei Spalten
+        gs = fig.add_gridspec(2, 3, hspace=0.3, wspace=0.3)
         
         # 1. H(z)
         ax1 = fig.add_subplot(gs[0, :2])
-        z = np.logspace(-2, 3, 200)
-        H_gtt = np.array([self.model.hubble_at_z(zi) for zi in z])
-        ax1.plot(z, H_gtt, color=self.colors['gtt'], linewidth=2.5, label='GTT')
+        self._draw_hubble(ax1, grids['z'], grids['H_gtt'])
         ax1.set_xlabel('z', fontsize=11)
         ax1.set_ylabel('H(z) [km/s/Mpc]', fontsize=11)
-        ax1.set_xscale('log')
         ax1.set_title('Hubble-Parameter', fontsize=12, fontweight='bold')
         ax1.legend(fontsize=10)
-        ax1.grid(True, alpha=0.3)
         
         # 2. Fraktale Dimension
         ax2 = fig.add_subplot(gs[0, 2])
-        chi = np.linspace(-30, 30, 200)
-        D = np.array([self.model.fractal_dimension(c) for c in chi])
-        ax2.plot(chi, D, color=self.colors['gtt'], linewidth=2.5)
+        central = np.abs(grids['chi']) <= 30.0
+        self._draw_fractal(ax2, grids['chi'][central], grids['D'][central])
         ax2.axhline(self.model.gtt.D_asymptotic, color='red', linestyle='--', alpha=0.5)
         ax2.set_xlabel('χ', fontsize=11)
         ax2.set_ylabel('D(χ)', fontsize=11)
         ax2.set_title('Fraktale Dimension', fontsize=12, fontweight='bold')
-        ax2.grid(True, alpha=0.3)
         
         # 3. Primordiales Spektrum
         ax3 = fig.add_subplot(gs[1, :2])
-        k = np.logspace(-4, 0, 200)
-        P_s = self.model.primordial_scalar_spectrum(k)
-        ax3.loglog(k, P_s, color=self.colors['gtt'], linewidth=2.5, label='GTT')
+        self._draw_primordial(ax3, grids['k'], grids['P_s'])
         ax3.set_xlabel('k [Mpc⁻¹]', fontsize=11)
         ax3.set_ylabel('P_s(k)', fontsize=11)
         ax3.set_title('Primordiales Spektrum', fontsize=12, fontweight='bold')
         ax3.legend(fontsize=10)
-        ax3.grid(True, alpha=0.3)
         
         # 4. Vorhersagen
         ax4 = fig.add_subplot(gs[1, 2])
@@ -370,30 +502,32 @@ class GTTPlotter:
 GTT-VORHERSAGEN
 
 Hubble-Spannung:
-  H₀ (früh): {pred['H0_early']:.1f}
-  H₀ (spät): {pred['H0_late']:.1f}
-  Spannung: {pred['H0_tension_percent']:.1f}%
+  H₀ (früh): {pred.H0_early:.1f}
+  H₀ (spät): {pred.H0_late:.1f}
+  Spannung: {pred.H0_tension_percent:.1f}%
 
 Primordial:
-  r: {pred['r_tensor']:.4f}
-  β_iso: {pred['beta_iso']:.3f}
+  r: {pred.r_tensor:.4f}
+  β_iso: {pred.beta_iso:.3f}
 
 Neutrinos:
-  ⟨m_ββ⟩: {pred['m_betabeta_meV']:.1f} meV
+  ⟨m_ββ⟩: {pred.m_betabeta_meV:.1f} meV
 
 Geometrie:
-  D_∞: {pred['D_asymptotic']:.4f}
-  θ_max: {pred['theta_max']:.1f}°
+  D_∞: {pred.D_asymptotic:.4f}
+  θ_max: {pred.theta_max:.1f}°
         """
         
         ax4.text(0.1, 0.5, text, fontsize=10, family='monospace',
                 verticalalignment='center')
         
-        plt.suptitle('GTT-WELTFORMEL: Zusammenfassung', 
-                    fontsize=18, fontweight='bold', y=0.98)
+        fig.suptitle('GTT-WELTFORMEL: Zusammenfassung', 
+                     fontsize=18, fontweight='bold', y=0.98)
         
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        self._save_figure(fig, save_path, dpi)
         print(f"Zusammenfassungs-Plot gespeichert: {save_path}")
+        if pyplot_managed:
+            plt.close(fig)
 
 
 def main():
@@ -405,16 +539,16 @@ def main():
     
     # Alle Plots erstellen
     print("1. Hubble-Evolution...")
-    plotter.plot_hubble_evolution('gtt_hubble_evolution.png')
+    plotter.plot_hubble_evolution('gtt_hubble_evolution.pdf')
     
     print("2. Primordiale Spektren...")
-    plotter.plot_primordial_spectra('gtt_primordial_spectra.png')
+    plotter.plot_primordial_spectra('gtt_primordial_spectra.pdf')
     
     print("3. Fraktale Dimension...")
-    plotter.plot_fractal_dimension('gtt_fractal_dimension.png')
+    plotter.plot_fractal_dimension('gtt_fractal_dimension.pdf')
     
     print("4. Detektions-Aussichten...")
-    plotter.plot_detection_prospects('gtt_detection_prospects.png')
+    plotter.plot_detection_prospects('gtt_detection_prospects.pdf')
     
     print("5. Zusammenfassung...")
     plotter.create_summary_plot('gtt_summary.png')
@@ -12,8 +12,16 @@ Verwendung:
 Autor: GTT Theory Group
 """
 
+import io
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+
+# Nicht-interaktives Backend: die Plots werden nur als Dateien gespeichert
+# (gilt auch für die Worker-Prozesse, die dieses Modul importieren)
+import matplotlib
+matplotlib.use('Agg')
 
 # Füge Python-Modul-Pfad hinzu
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'python'))
@@ -24,6 +32,30 @@ from plot_predictions import GTTPlotter
 import numpy as np
 
 
+# Plots: (Beschreibung, GTTPlotter-Methode, Dateiname)
+PLOTS = [
+    ("Hubble-Evolution", 'plot_hubble_evolution', 'gtt_hubble_evolution.pdf'),
+    ("Primordiale Spektren", 'plot_primordial_spectra', 'gtt_primordial_spectra.pdf'),
+    ("Fraktale Dimension", 'plot_fractal_dimension', 'gtt_fractal_dimension.pdf'),
+    ("Detektions-Aussichten", 'plot_detection_prospects', 'gtt_detection_prospects.pdf'),
+    ("Zusammenfassung", 'create_summary_plot', 'gtt_summary.png'),
+]
+
+
+def _render_plot(job):
+    """Erstellt einen Plot in einem Worker-Prozess"""
+    description, cosmo, gtt, method, filename = job
+    output = io.StringIO()
+    with redirect_stdout(output):
+        plotter = GTTPlotter(GTTModel(cosmo, gtt))
+        getattr(plotter, method)(filename)
+    
+    # Beschreibung und Speichermeldung in einem Schreibvorgang, damit sich
+    # die Zeilen paralleler Worker nicht vermischen
+    sys.stdout.write(f"   - {description}: {output.getvalue()}")
+    sys.stdout.flush()
+
+
 def print_header(text):
     """Druckt formatierten Header"""
     print("\n" + "=" * 70)
@@ -72,36 +104,29 @@ def main():
     # 3. Analyzer erstellen
     print("\n3. Erstelle Analyse-Report...")
     analyzer = GTTAnalyzer(model)
-    report = analyzer.generate_report()
     
     # Report ausgeben
-    print(report)
+    analyzer.stream_report(sys.stdout)
+    print()
     
-    # Report speichern
+    # Report speichern (direkt in die Datei, ohne Zwischen-String)
     report_file = 'gtt_full_analysis_report.txt'
     with open(report_file, 'w') as f:
-        f.write(report)
+        analyzer.stream_report(f)
     print(f"\n   ✓ Report gespeichert: {report_file}")
     
     # 4. Plots erstellen
     print("\n4. Erstelle Visualisierungen...")
-    plotter = GTTPlotter(model)
+    
+    # Die Plots sind unabhängig voneinander: ein Prozess pro Plot
+    jobs = [(description, model.cosmo, model.gtt, method, filename)
+            for description, method, filename in PLOTS]
     
     try:
-        print("   - Hubble-Evolution...")
-        plotter.plot_hubble_evolution('gtt_hubble_evolution.png')
-        
-        print("   - Primordiale Spektren...")
-        plotter.plot_primordial_spectra('gtt_primordial_spectra.png')
-        
-        print("   - Fraktale Dimension...")
-        plotter.plot_fractal_dimension('gtt_fractal_dimension.png')
-        
-        print("   - Detektions-Aussichten...")
-        plotter.plot_detection_prospects('gtt_detection_prospects.png')
-        
-        print("   - Zusammenfassung...")
-        plotter.create_summary_plot('gtt_summary.png')
+        sys.stdout.flush()  # Puffer nicht in die Worker kopieren
+        n_workers = min(len(jobs), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            list(executor.map(_render_plot, jobs))
         
         print("   ✓ Alle Plots erstellt")
     except Exception as e:
@@ -197,10 +222,10 @@ def main():
     print()
     print("Generierte Dateien:")
     print("  - gtt_full_analysis_report.txt")
-    print("  - gtt_hubble_evolution.png")
-    print("  - gtt_primordial_spectra.png")
-    print("  - gtt_fractal_dimension.png")
-    print("  - gtt_detection_prospects.png")
+    print("  - gtt_hubble_evolution.pdf")
+    print("  - gtt_primordial_spectra.pdf")
+    print("  - gtt_fractal_dimension.pdf")
+    print("  - gtt_detection_prospects.pdf")
     print("  - gtt_summary.png")
     print()
 